@@ -1,27 +1,33 @@
+from __future__ import annotations
+
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import json
 import os
 import time
 import re
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, List
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urljoin, urlparse
 import threading
+import multiprocessing.util
+import shutil
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
-import chromedriver_autoinstaller
-import undetected_chromedriver as uc
-from tqdm import tqdm
 import glob
 
+# Selenium, undetected-chromedriver, bs4, tqdm, aiohttp, requests-cache and watchdog
+# are imported where they are used, so runs that never need them don't pay for loading them
+if TYPE_CHECKING:
+    import aiohttp
+    from selenium import webdriver
+    from watchdog.events import FileSystemEvent
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -40,6 +46,12 @@ class DownloadConfig:
     retry_count: int = 3
     download_timeout: int = 600
     poll_interval: float = 0.5
+    max_poll_interval: float = 5.0
+    redirect_timeout: float = 30
+    max_workers: int = min(os.cpu_count() or 1, 4)
+    request_stagger: float = 0.1
+    flaresolverr_cache: Optional[str] = "flaresolverr_cache"
+    flaresolverr_cache_ttl: int = 1800
 
 @dataclass
 class FlareSolverrResult:
@@ -50,36 +62,196 @@ class FlareSolverrResult:
     user_agent: Optional[str] = None
     error: Optional[str] = None
 
+class _DownloadEventHandler:
+    """Track download-related files reported by watchdog filesystem events."""
+
+    def __init__(self, extensions: List[str]):
+        self.extensions = tuple(extensions)
+        self._paths: Dict[Path, None] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+
+    def _add(self, path: str, notify: bool = True) -> None:
+        if path.endswith(self.extensions):
+            with self._lock:
+                self._paths[Path(path)] = None
+            if notify:
+                self._changed.set()
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self._paths.pop(path, None)
+        self._changed.set()
+
+    def seed(self, paths) -> None:
+        for path in paths:
+            if path.is_file():
+                self._add(str(path))
+
+    def snapshot(self) -> List[Path]:
+        with self._lock:
+            return list(self._paths)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a relevant event arrives or the timeout expires."""
+        changed = self._changed.wait(timeout)
+        self._changed.clear()
+        return changed
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Handle an event from the watchdog observer thread."""
+        if event.is_directory:
+            return
+        if event.event_type == "created":
+            self._add(event.src_path)
+        elif event.event_type == "modified":
+            # Writes are frequent, progress is sampled on the poll timeout instead of waking per write
+            self._add(event.src_path, notify=False)
+        elif event.event_type == "moved":
+            self.discard(Path(event.src_path))
+            self._add(event.dest_path)
+        elif event.event_type == "deleted":
+            self.discard(Path(event.src_path))
+
 class HLTVDownloader:
     """Improved HLTV demo file downloader with better error handling and structure."""
     
     DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
     TEMP_EXTENSIONS = [".crdownload", ".part", ".tmp"]
     DEMO_EXTENSIONS = [".rar", ".zip", ".dem", ".7z"]
+    CHROMEDRIVER_CACHE = Path.home() / ".cache" / "hltvsele" / "chromedriver_path"
+    CHROMEDRIVER_CHECK_TTL = 24 * 60 * 60
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+        "*.woff*", "*.ttf", "*.css",
+        "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+    ]
+    # Matches window.location, window.location.href and location.href assignments of a
+    # complete demo file URL literal, terminated by ';' or the end of the line
+    JS_REDIRECT_RE = re.compile(
+        r"(?:window\.)?location(?:\.href)?\s*=\s*['\"]([^'\"]+(?:"
+        + "|".join(re.escape(ext) for ext in DEMO_EXTENSIONS)
+        + r"))['\"]\s*(?:;|$)",
+        re.MULTILINE
+    )
     
     def __init__(self, config: DownloadConfig):
         self.config = config
         self.download_dir = Path(config.download_dir).resolve()
         self._setup_download_directory()
         self._install_chromedriver()
+        self._session = self._create_session()
+        # Archive downloads bypass the FlareSolverr cache and its JSON headers
+        self._download_session = requests.Session()
+        self._driver: Optional[webdriver.Chrome] = None
+
+    def __enter__(self) -> "HLTVDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Quit the persistent WebDriver and release HTTP connections."""
+        self._quit_driver()
+        self._session.close()
+        self._download_session.close()
+
+    def _quit_driver(self) -> None:
+        """Quit the persistent WebDriver if one is running."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing driver: {e}")
+            self._driver = None
         
     def _setup_download_directory(self) -> None:
         """Create download directory if it doesn't exist."""
         self.download_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Download directory: {self.download_dir}")
+
+    def clear_download_directory(self) -> None:
+        """Remove leftovers such as partial downloads from earlier jobs."""
+        for entry in self.download_dir.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
         
     def _install_chromedriver(self) -> None:
-        """Install or update ChromeDriver."""
+        """Install or update ChromeDriver, at most once per CHROMEDRIVER_CHECK_TTL."""
+        cache_file = self.CHROMEDRIVER_CACHE
         try:
-            chromedriver_autoinstaller.install()
-            logger.info("ChromeDriver installed/updated successfully")
+            if time.time() - cache_file.stat().st_mtime < self.CHROMEDRIVER_CHECK_TTL:
+                driver_path = Path(cache_file.read_text().strip())
+                if driver_path.is_file():
+                    logger.debug(f"ChromeDriver checked recently, using {driver_path}")
+                    self._add_to_path(driver_path.parent)
+                    return
+        except OSError:
+            pass
+
+        try:
+            import chromedriver_autoinstaller
+
+            driver_path = chromedriver_autoinstaller.install()
         except Exception as e:
-            logger.warning(f"Failed to auto-install ChromeDriver: {e}")
+            logger.warning(f"Failed to auto-install ChromeDriver, using system driver: {e}")
+            return
 
-    def get_flaresolverr_solution(self, url: str) -> FlareSolverrResult:
-        """Use FlareSolverr to bypass Cloudflare protection."""
+        if not driver_path:
+            logger.warning("No matching ChromeDriver found, using system driver")
+            return
+        logger.info("ChromeDriver installed/updated successfully")
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(str(driver_path))
+        except OSError as e:
+            logger.debug(f"Failed to record ChromeDriver check: {e}")
+
+    @staticmethod
+    def _add_to_path(directory: Path) -> None:
+        """Prepend a directory to PATH like chromedriver_autoinstaller.install() does."""
+        entries = os.environ.get("PATH", "").split(os.pathsep)
+        if str(directory) not in entries:
+            os.environ["PATH"] = os.pathsep.join([str(directory)] + [e for e in entries if e])
+
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session reused for all FlareSolverr requests."""
+        if self.config.flaresolverr_cache:
+            import requests_cache
+
+            # The POST body holds the target URL and proxy, so it is part of the cache key
+            session = requests_cache.CachedSession(
+                self.config.flaresolverr_cache,
+                backend="sqlite",
+                expire_after=self.config.flaresolverr_cache_ttl,
+                allowable_methods=("POST",),
+                match_headers=True,
+                filter_fn=self._is_successful_solution,
+            )
+        else:
+            session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=0))
+        session.mount("http://", adapter)
+        session.headers["Content-Type"] = "application/json"
+        return session
+
+    @staticmethod
+    def _is_successful_solution(response: requests.Response) -> bool:
+        """Only cache FlareSolverr responses that contain a solution."""
+        if response.request.method != "POST" or response.status_code != 200:
+            return False
+        try:
+            return response.json().get("status") == "ok"
+        except ValueError:
+            return False
+
+    def _build_flaresolverr_request(self, url: str) -> Tuple[str, Dict[str, Any]]:
+        """Build the FlareSolverr endpoint and request payload for a URL."""
         flaresolverr_url = f"http://{self.config.flaresolverr_host}:{self.config.flaresolverr_port}/v1"
-        headers = {"Content-Type": "application/json"}
         payload = {
             "cmd": "request.get",
             "url": url,
@@ -89,29 +261,40 @@ class HLTVDownloader:
         if self.config.proxy:
             payload["proxy"] = {"url": self.config.proxy}
 
+        return flaresolverr_url, payload
+
+    def _parse_flaresolverr_response(self, result: Dict[str, Any], url: str, attempt: int) -> Optional[FlareSolverrResult]:
+        """Convert a FlareSolverr JSON response into a result, or None if it failed."""
+        if result.get("status") == "ok":
+            logger.info(f"FlareSolverr succeeded for {url}")
+            return FlareSolverrResult(
+                success=True,
+                html=result["solution"]["response"],
+                cookies=result["solution"]["cookies"],
+                user_agent=result["solution"]["userAgent"]
+            )
+
+        error_msg = result.get('message', 'Unknown error')
+        logger.warning(f"FlareSolverr attempt {attempt + 1} failed: {error_msg}")
+        return None
+
+    def get_flaresolverr_solution(self, url: str) -> FlareSolverrResult:
+        """Use FlareSolverr to bypass Cloudflare protection."""
+        flaresolverr_url, payload = self._build_flaresolverr_request(url)
+
         for attempt in range(self.config.retry_count):
             try:
                 logger.info(f"FlareSolverr attempt {attempt + 1}/{self.config.retry_count} for {url}")
-                response = requests.post(
+                response = self._session.post(
                     flaresolverr_url, 
-                    headers=headers, 
                     json=payload, 
                     timeout=self.config.max_timeout/1000 + 10
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
-                    if result.get("status") == "ok":
-                        logger.info(f"FlareSolverr succeeded for {url}")
-                        return FlareSolverrResult(
-                            success=True,
-                            html=result["solution"]["response"],
-                            cookies=result["solution"]["cookies"],
-                            user_agent=result["solution"]["userAgent"]
-                        )
-                    else:
-                        error_msg = result.get('message', 'Unknown error')
-                        logger.warning(f"FlareSolverr attempt {attempt + 1} failed: {error_msg}")
+                    solution = self._parse_flaresolverr_response(response.json(), url, attempt)
+                    if solution:
+                        return solution
                 else:
                     logger.warning(f"FlareSolverr HTTP error {response.status_code}")
                     
@@ -125,9 +308,63 @@ class HLTVDownloader:
                 
         return FlareSolverrResult(success=False, error="Max retries exceeded")
 
+    async def get_flaresolverr_solution_async(self, url: str, session: aiohttp.ClientSession,
+                                              delay: float = 0) -> FlareSolverrResult:
+        """Asynchronous variant of get_flaresolverr_solution sharing an aiohttp session."""
+        import aiohttp
+
+        flaresolverr_url, payload = self._build_flaresolverr_request(url)
+        timeout = aiohttp.ClientTimeout(total=self.config.max_timeout/1000 + 10)
+
+        # FlareSolverr fetches the page itself, so space out the hits on hltv.org
+        await asyncio.sleep(delay)
+
+        for attempt in range(self.config.retry_count):
+            try:
+                logger.info(f"FlareSolverr attempt {attempt + 1}/{self.config.retry_count} for {url}")
+                async with session.post(flaresolverr_url, json=payload, timeout=timeout) as response:
+                    if response.status == 200:
+                        solution = self._parse_flaresolverr_response(await response.json(), url, attempt)
+                        if solution:
+                            return solution
+                    else:
+                        logger.warning(f"FlareSolverr HTTP error {response.status}")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"FlareSolverr network error on attempt {attempt + 1}: {e}")
+            except Exception as e:
+                logger.error(f"FlareSolverr unexpected error on attempt {attempt + 1}: {e}")
+
+            if attempt < self.config.retry_count - 1:
+                await asyncio.sleep(5)
+
+        return FlareSolverrResult(success=False, error="Max retries exceeded")
+
+    async def get_flaresolverr_solutions(self, urls: List[str]) -> List[FlareSolverrResult]:
+        """Resolve many URLs through FlareSolverr concurrently, staggered by request_stagger."""
+        if self.config.flaresolverr_cache:
+            # Go through the cached session so repeated runs skip FlareSolverr entirely
+            async def solve(index: int, url: str) -> FlareSolverrResult:
+                await asyncio.sleep(index * self.config.request_stagger)
+                return await asyncio.to_thread(self.get_flaresolverr_solution, url)
+
+            return await asyncio.gather(*[solve(index, url) for index, url in enumerate(urls)])
+
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*[
+                self.get_flaresolverr_solution_async(url, session, delay=index * self.config.request_stagger)
+                for index, url in enumerate(urls)
+            ])
+
     def _find_download_url_from_html(self, html: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract download URL and filename from HTML content."""
-        soup = BeautifulSoup(html, "html.parser")
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        # Only the redirect carriers are needed, so skip building the rest of the tree
+        soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer(["meta", "script"]))
         download_url = None
         expected_filename = None
         
@@ -144,21 +381,12 @@ class HLTVDownloader:
         if not download_url:
             scripts = soup.find_all("script")
             for script in scripts:
-                if script.string and "window.location" in script.string:
-                    patterns = [
-                        r"window\.location\s*=\s*['\"](.*?)['\"]\s*;",
-                        r"window\.location\.href\s*=\s*['\"](.*?)['\"]\s*;",
-                        r"location\.href\s*=\s*['\"](.*?)['\"]\s*;"
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, script.string)
-                        if match and any(match.group(1).endswith(ext) for ext in self.DEMO_EXTENSIONS):
-                            download_url = match.group(1)
-                            expected_filename = self._extract_filename_from_url(download_url)
-                            logger.info(f"Found JavaScript redirect URL: {download_url}")
-                            break
-                    if download_url:
+                if script.string and "location" in script.string:
+                    match = self.JS_REDIRECT_RE.search(script.string)
+                    if match:
+                        download_url = match.group(1)
+                        expected_filename = self._extract_filename_from_url(download_url)
+                        logger.info(f"Found JavaScript redirect URL: {download_url}")
                         break
 
         return download_url, expected_filename
@@ -174,10 +402,23 @@ class HLTVDownloader:
             return None
 
     def _setup_driver(self, user_agent: Optional[str] = None) -> webdriver.Chrome:
-        """Setup and configure Chrome WebDriver."""
+        """Setup and configure Chrome WebDriver, reusing the running one if available."""
         effective_user_agent = user_agent or self.DEFAULT_USER_AGENT
+
+        if self._driver is not None:
+            from selenium.common.exceptions import WebDriverException
+
+            try:
+                self._reset_driver(self._driver, effective_user_agent)
+                return self._driver
+            except WebDriverException as e:
+                # The browser died since the last download, replace it
+                logger.warning(f"Persistent driver is unusable, restarting Chrome: {e}")
+                self._quit_driver()
         
         if self.config.use_undetected:
+            import undetected_chromedriver as uc
+
             options = uc.ChromeOptions()
             options.add_argument(f"user-agent={effective_user_agent}")
             options.add_argument("--no-sandbox")
@@ -186,22 +427,44 @@ class HLTVDownloader:
             options.add_argument("--disable-notifications")
             options.add_argument("--disable-extensions")
             options.add_argument("--window-size=1920,1080")
+            options.add_argument("--blink-settings=imagesEnabled=false")
             
             try:
                 driver = uc.Chrome(options=options, version_main=138)
             except Exception as e:
                 logger.warning(f"Failed to create undetected Chrome driver: {e}")
                 # Fallback to regular Chrome
-                return self._setup_regular_driver(effective_user_agent)
+                driver = self._setup_regular_driver(effective_user_agent)
         else:
             driver = self._setup_regular_driver(effective_user_agent)
             
         driver.set_page_load_timeout(30)
         driver.set_script_timeout(30)
+        self._block_unneeded_resources(driver)
+        self._driver = driver
         return driver
 
+    def _reset_driver(self, driver: webdriver.Chrome, user_agent: str) -> None:
+        """Clear state left by the previous download before reusing the driver."""
+        driver.delete_all_cookies()
+        try:
+            driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": user_agent})
+        except Exception as e:
+            logger.warning(f"Failed to update user agent: {e}")
+
+    def _block_unneeded_resources(self, driver: webdriver.Chrome) -> None:
+        """Block images, fonts, stylesheets and trackers at the DevTools network layer."""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Failed to block resources via CDP: {e}")
+
     def _setup_regular_driver(self, user_agent: str) -> webdriver.Chrome:
         """Setup regular Chrome WebDriver."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         options = Options()
         options.add_argument(f"user-agent={user_agent}")
         options.add_argument("--headless=new")
@@ -222,6 +485,7 @@ class HLTVDownloader:
             "safebrowsing.enabled": True,
             "profile.default_content_settings.popups": 0,
             "profile.default_content_setting_values.automatic_downloads": 1,
+            "profile.managed_default_content_settings.images": 2,
         }
         options.add_experimental_option("prefs", prefs)
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -251,88 +515,237 @@ class HLTVDownloader:
         except Exception as e:
             logger.error(f"Failed to set cookies: {e}")
 
-    def monitor_download(self, expected_filename: Optional[str] = None) -> Optional[Path]:
-        """Monitor download directory with progress tracking."""
+    def _wait_for_redirect(self, driver: webdriver.Chrome, url: str, since: Optional[float] = None) -> None:
+        """Wait until the page redirects, exposes a redirect target or starts a download."""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        def redirect_resolved(d: webdriver.Chrome) -> bool:
+            if d.current_url != url:
+                return True
+            if self._download_started(since):
+                return True
+            return d.execute_script(
+                "return !!document.querySelector('meta[http-equiv=refresh]') || "
+                "Array.from(document.scripts).some(s => s.text.includes('location'));"
+            )
+
+        try:
+            WebDriverWait(driver, self.config.redirect_timeout, poll_frequency=0.25).until(redirect_resolved)
+        except TimeoutException:
+            logger.info(f"No redirect detected within {self.config.redirect_timeout}s, continuing")
+
+    def _download_started(self, since: Optional[float] = None) -> bool:
+        """Check whether a temporary or demo file has appeared in the download directory."""
+        extensions = tuple(self.TEMP_EXTENSIONS + self.DEMO_EXTENSIONS)
+        return any(
+            f.name.endswith(extensions) and not self._is_stale(f, since)
+            for f in self.download_dir.iterdir() if f.is_file()
+        )
+
+    @staticmethod
+    def _is_stale(path: Path, since: Optional[float]) -> bool:
+        """Check whether a file was last written before the current download started."""
+        if since is None:
+            return False
+        try:
+            return path.stat().st_mtime < since
+        except FileNotFoundError:
+            return True
+
+    def download_direct(self, download_url: str, flaresolverr_result: FlareSolverrResult,
+                        expected_filename: Optional[str] = None) -> Optional[Path]:
+        """Stream a demo archive to disk with requests using the FlareSolverr cookies."""
+        from tqdm import tqdm
+
+        cookiejar = requests.cookies.RequestsCookieJar()
+        for cookie in flaresolverr_result.cookies or []:
+            cookiejar.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/")
+            )
+
+        headers = {"User-Agent": flaresolverr_result.user_agent or self.DEFAULT_USER_AGENT}
+        proxies = {"http": self.config.proxy, "https": self.config.proxy} if self.config.proxy else None
+        filename = expected_filename or self._extract_filename_from_url(download_url) or "demo.rar"
+        target = self.download_dir / filename
+        part_file = target.with_name(target.name + ".part")
+
+        start_time = time.time()
+        try:
+            logger.info(f"Downloading directly: {download_url}")
+            with self._download_session.get(
+                download_url,
+                stream=True,
+                cookies=cookiejar,
+                headers=headers,
+                proxies=proxies,
+                timeout=(30, 60)
+            ) as response:
+                response.raise_for_status()
+                total = int(response.headers.get("Content-Length", 0)) or None
+
+                # Read timeouts only bound each socket read, so enforce download_timeout
+                # per chunk; read1 returns whatever arrived instead of waiting for a full chunk
+                with open(part_file, "wb") as f, tqdm(
+                    total=total,
+                    desc=f"Downloading {filename}",
+                    unit="B",
+                    unit_scale=True,
+                    leave=True
+                ) as pbar:
+                    while chunk := response.raw.read1(1 << 20, decode_content=True):
+                        if time.time() - start_time > self.config.download_timeout:
+                            raise TimeoutError(f"exceeded {self.config.download_timeout}s")
+                        f.write(chunk)
+                        pbar.update(len(chunk))
+
+            part_file.replace(target)
+            logger.info(f"Download completed: {target}")
+            return target
+
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            logger.error(f"Direct download failed: {e}")
+        except TimeoutError as e:
+            logger.error(f"Direct download timed out: {e}")
+        except OSError as e:
+            logger.error(f"Failed to write {part_file}: {e}")
+
+        part_file.unlink(missing_ok=True)
+        return None
+
+    def monitor_download(self, expected_filename: Optional[str] = None, since: Optional[float] = None) -> Optional[Path]:
+        """Monitor download directory with progress tracking.
+
+        Files last written before ``since`` are ignored, so output left over from an
+        earlier download is never returned. When ``expected_filename`` is known only
+        that file (or its temporary variant) is accepted.
+        """
+        from tqdm import tqdm
+        from watchdog.observers import Observer
+
         logger.info(f"Monitoring download directory: {self.download_dir}")
         start_time = time.time()
         pbar = None
         last_size = 0
         monitored_file = None
+        interval = self.config.poll_interval
 
-        while time.time() - start_time < self.config.download_timeout:
-            files = list(self.download_dir.glob("*"))
-            
-            # Find the most relevant file to monitor
-            for file_path in files:
-                if not file_path.is_file():
-                    continue
-                    
-                filename = file_path.name
+        # Wake on filesystem events instead of rescanning the directory
+        handler = _DownloadEventHandler(self.TEMP_EXTENSIONS + self.DEMO_EXTENSIONS)
+        observer = Observer()
+        observer.schedule(handler, str(self.download_dir), recursive=False)
+        observer.start()
+        handler.seed(self.download_dir.glob("*"))
+
+        try:
+            while time.time() - start_time < self.config.download_timeout:
+                files = handler.snapshot()
                 
-                # Priority: expected filename > temp files > any demo files
-                if expected_filename and expected_filename in filename:
-                    monitored_file = file_path
-                    break
-                elif any(filename.endswith(ext) for ext in self.TEMP_EXTENSIONS):
-                    monitored_file = file_path
-                    break
-                elif any(filename.endswith(ext) for ext in self.DEMO_EXTENSIONS):
-                    monitored_file = file_path
-
-            if monitored_file:
-                try:
-                    file_size = monitored_file.stat().st_size
+                # Find the most relevant file to monitor
+                for file_path in files:
+                    filename = file_path.name
+                    if self._is_stale(file_path, since):
+                        continue
                     
-                    # Initialize progress bar if needed
-                    if pbar is None:
-                        pbar = tqdm(
-                            total=None, 
-                            desc=f"Downloading {monitored_file.name}", 
-                            unit="B", 
-                            unit_scale=True, 
-                            leave=True
-                        )
-                    
-                    # Check if it's a temporary file (still downloading)
-                    if any(str(monitored_file).endswith(ext) for ext in self.TEMP_EXTENSIONS):
-                        pbar.update(file_size - last_size)
-                        last_size = file_size
-                    else:
-                        # Download completed
-                        pbar.n = file_size
-                        pbar.set_description(f"Download complete: {monitored_file.name}")
-                        pbar.close()
-                        logger.info(f"Download completed: {monitored_file}")
-                        return monitored_file
+                    # Only the expected file when known, otherwise temp files > any demo files
+                    if expected_filename:
+                        if expected_filename in filename:
+                            monitored_file = file_path
+                            break
+                    elif any(filename.endswith(ext) for ext in self.TEMP_EXTENSIONS):
+                        monitored_file = file_path
+                        break
+                    elif any(filename.endswith(ext) for ext in self.DEMO_EXTENSIONS):
+                        monitored_file = file_path
+
+                if monitored_file:
+                    try:
+                        file_size = monitored_file.stat().st_size
                         
-                except FileNotFoundError:
-                    logger.debug(f"File {monitored_file} disappeared, continuing...")
-                    last_size = 0
-                    if pbar:
-                        pbar.close()
-                        pbar = None
-                    monitored_file = None
-                except Exception as e:
-                    logger.error(f"Error monitoring file {monitored_file}: {e}")
+                        # Initialize progress bar if needed
+                        if pbar is None:
+                            pbar = tqdm(
+                                total=None, 
+                                desc=f"Downloading {monitored_file.name}", 
+                                unit="B", 
+                                unit_scale=True, 
+                                leave=True
+                            )
+                        
+                        # Check if it's a temporary file (still downloading)
+                        if any(str(monitored_file).endswith(ext) for ext in self.TEMP_EXTENSIONS):
+                            # Poll quickly while data arrives, back off while the download stalls
+                            if file_size == last_size:
+                                interval = min(interval * 2, self.config.max_poll_interval)
+                            else:
+                                interval = self.config.poll_interval
+                            pbar.update(file_size - last_size)
+                            last_size = file_size
+                        else:
+                            # Download completed
+                            pbar.n = file_size
+                            pbar.set_description(f"Download complete: {monitored_file.name}")
+                            pbar.close()
+                            logger.info(f"Download completed: {monitored_file}")
+                            return monitored_file
+                            
+                    except FileNotFoundError:
+                        logger.debug(f"File {monitored_file} disappeared, continuing...")
+                        handler.discard(monitored_file)
+                        last_size = 0
+                        if pbar:
+                            pbar.close()
+                            pbar = None
+                        monitored_file = None
+                        continue
+                    except Exception as e:
+                        logger.error(f"Error monitoring file {monitored_file}: {e}")
+                else:
+                    interval = min(interval * 2, self.config.max_poll_interval)
 
-            time.sleep(self.config.poll_interval)
+                handler.wait(interval)
+        finally:
+            observer.stop()
+            observer.join()
 
         if pbar:
             pbar.close()
         logger.warning("Download monitoring timed out or no file detected")
         return None
 
-    def download_demo(self, url: str) -> Optional[Path]:
+    def download_demo(self, url: str, flaresolverr_result: Optional[FlareSolverrResult] = None) -> Optional[Path]:
         """Main method to download a demo file from HLTV."""
         logger.info(f"Starting download process for: {url}")
+        started_at = time.time()
         
-        # Try FlareSolverr first
-        flaresolverr_result = self.get_flaresolverr_solution(url)
+        # Try FlareSolverr first unless a solution was already resolved
+        if flaresolverr_result is None:
+            flaresolverr_result = self.get_flaresolverr_solution(url)
         
         if not flaresolverr_result.success and not self.config.use_undetected:
             logger.error(f"Failed to bypass Cloudflare: {flaresolverr_result.error}")
             return None
 
+        # FlareSolverr already rendered the page, so skip the browser when it holds the redirect
+        direct_url = None
+        if flaresolverr_result.success and flaresolverr_result.html:
+            direct_url, expected_filename = self._find_download_url_from_html(flaresolverr_result.html)
+            if direct_url:
+                direct_url = urljoin(url, direct_url)
+                if direct_url.endswith(tuple(self.DEMO_EXTENSIONS)):
+                    downloaded_file = self.download_direct(direct_url, flaresolverr_result, expected_filename)
+                    if downloaded_file:
+                        return downloaded_file
+                    logger.info("Direct download from FlareSolverr page failed, falling back to browser")
+
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         # Setup WebDriver
         user_agent = flaresolverr_result.user_agent if flaresolverr_result.success else None
         driver = self._setup_driver(user_agent)
@@ -351,8 +764,8 @@ class HLTVDownloader:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # Give some time for potential JavaScript redirects or downloads to start
-            time.sleep(3)
+            # Wait for potential JavaScript redirects or downloads to start
+            self._wait_for_redirect(driver, url, started_at)
             
             # Try to find download URL from page content
             download_url, expected_filename = self._find_download_url_from_html(driver.page_source)
@@ -362,12 +775,24 @@ class HLTVDownloader:
                 # Navigate to the actual download URL if needed
                 if not download_url.startswith('http'):
                     download_url = urljoin(url, download_url)
-                driver.get(download_url)
-                time.sleep(2)
+
+                # Stream the archive directly when we hold valid Cloudflare cookies
+                if (flaresolverr_result.success and download_url != direct_url
+                        and download_url.endswith(tuple(self.DEMO_EXTENSIONS))):
+                    downloaded_file = self.download_direct(download_url, flaresolverr_result, expected_filename)
+                    if downloaded_file:
+                        return downloaded_file
+                    logger.info("Direct download failed, falling back to browser download")
+
+                if download_url.endswith(tuple(self.DEMO_EXTENSIONS)):
+                    # A direct archive only triggers a download, don't wait for a page load
+                    driver.execute_cdp_cmd("Page.navigate", {"url": download_url})
+                else:
+                    driver.get(download_url)
 
             # Start monitoring download
             logger.info("Starting download monitoring...")
-            downloaded_file = self.monitor_download(expected_filename)
+            downloaded_file = self.monitor_download(expected_filename, since=started_at)
             
             return downloaded_file
 
@@ -376,15 +801,57 @@ class HLTVDownloader:
             return None
         except WebDriverException as e:
             logger.error(f"WebDriver error: {e}")
+            # The browser may be unusable, start a fresh one on the next call
+            self._quit_driver()
             return None
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             return None
-        finally:
-            try:
-                driver.quit()
-            except Exception as e:
-                logger.warning(f"Error closing driver: {e}")
+
+_worker_downloader: Optional[HLTVDownloader] = None
+
+def _init_worker(config: DownloadConfig) -> None:
+    """Create the per-process downloader whose Chrome instance is reused for every job."""
+    global _worker_downloader
+    worker_dir = Path(config.download_dir).resolve() / f".worker-{os.getpid()}"
+    _worker_downloader = HLTVDownloader(replace(config, download_dir=str(worker_dir)))
+    # Quit Chrome when the pool shuts the worker down
+    multiprocessing.util.Finalize(_worker_downloader, _worker_downloader.close, exitpriority=10)
+
+def _download_worker(job: Tuple[str, DownloadConfig, FlareSolverrResult]) -> Optional[Path]:
+    """Download a single demo in a worker process with its own Chrome instance."""
+    url, config, flaresolverr_result = job
+    parent_dir = Path(config.download_dir).resolve()
+
+    try:
+        # The worker folder is reused across jobs, don't let a stale file match this one
+        _worker_downloader.clear_download_directory()
+        downloaded_file = _worker_downloader.download_demo(url, flaresolverr_result)
+        if downloaded_file is None:
+            return None
+        target = parent_dir / downloaded_file.name
+        shutil.move(str(downloaded_file), str(target))
+        return target
+    except Exception as e:
+        logger.error(f"Worker failed for {url}: {e}")
+        return None
+
+def download_many(urls: List[str], config: DownloadConfig) -> List[Optional[Path]]:
+    """Download several demos concurrently, one Chrome instance per worker process."""
+    # Resolve all Cloudflare challenges concurrently before the Selenium stage
+    with HLTVDownloader(config) as downloader:
+        solutions = asyncio.run(downloader.get_flaresolverr_solutions(urls))
+
+    jobs = [(url, config, solution) for url, solution in zip(urls, solutions)]
+    max_workers = max(1, min(config.max_workers, len(jobs)))
+    logger.info(f"Downloading {len(jobs)} demos with {max_workers} workers")
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(config,)) as executor:
+            return list(executor.map(_download_worker, jobs))
+    finally:
+        for worker_dir in Path(config.download_dir).resolve().glob(".worker-*"):
+            shutil.rmtree(worker_dir, ignore_errors=True)
 
 def main():
     """Example usage of the improved HLTV downloader."""
@@ -398,16 +865,16 @@ def main():
         retry_count=3
     )
     
-    downloader = HLTVDownloader(config)
-    url = "https://www.hltv.org/download/demo/98547"
+    urls = ["https://www.hltv.org/download/demo/98547"]
     
-    downloaded_file = downloader.download_demo(url)
+    downloaded_files = download_many(urls, config)
     
-    if downloaded_file:
-        logger.info(f"Successfully downloaded: {downloaded_file}")
-        logger.info(f"File size: {downloaded_file.stat().st_size / (1024*1024):.2f} MB")
-    else:
-        logger.error("Download failed")
+    for url, downloaded_file in zip(urls, downloaded_files):
+        if downloaded_file:
+            logger.info(f"Successfully downloaded: {downloaded_file}")
+            logger.info(f"File size: {downloaded_file.stat().st_size / (1024*1024):.2f} MB")
+        else:
+            logger.error(f"Download failed: {url}")
 
 if __name__ == "__main__":
     main()